@@ -503,7 +503,16 @@ run_tests() {
             main_tests_result=true
         fi
     else
-        if pytest $PYTEST_OPTIONS "$TEST_TARGET"; then
+        # Use xdist workers when installed. The wrapper is a single module of plain
+        # functions, so distribute per test; each test gets fresh fixtures and any
+        # shared owner/org/user is rebuilt per worker process
+        XDIST_OPTIONS=""
+        # Record/replay (AERUGO_TEST_CACHE=1) needs a serial run
+        if [ "$AERUGO_TEST_CACHE" != "1" ] && python3 -c "import xdist" 2>/dev/null; then
+            XDIST_OPTIONS="-n auto --dist load"
+        fi
+        
+        if pytest $PYTEST_OPTIONS $XDIST_OPTIONS "$TEST_TARGET"; then
             print_success "Main integration tests passed!"
             test_results+=("✅ Main integration tests: PASSED")
             main_tests_result=true
@@ -296,12 +296,18 @@ pub async fn register(
         }
     };
 
-    // Return success response with token
+    // Return success response with token and the created user, so clients
+    // don't need a follow-up /auth/me call to learn the user id
     (
         StatusCode::CREATED,
         Json(serde_json::json!({
             "token": token,
-            "message": "User registered successfully"
+            "message": "User registered successfully",
+            "user": {
+                "id": user.id,
+                "username": user.username,
+                "email": user.email
+            }
         })),
     )
 }
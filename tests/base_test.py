@@ -9,54 +9,200 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 import time
+import json
+import shelve
+import hashlib
+import secrets
+import threading
+from functools import lru_cache
 import subprocess
 import psycopg2
 import redis
-from typing import Dict, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, List, Sequence
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional faster JSON encoder/decoder
+    orjson = None
+
 try:
     from config import TEST_CONFIG, SERVER_URL, API_BASE, get_database_url
 except ImportError:
     from .config import TEST_CONFIG, SERVER_URL, API_BASE, get_database_url
 
 
+def create_http_session() -> requests.Session:
+    """Create a keep-alive HTTP session with a connection pool and retry policy"""
+    session = requests.Session()
+    # Retry refused/reset connects for any method, but only retry gateway errors
+    # for idempotent methods so a POST is never sent twice
+    retry = Retry(
+        total=2,
+        connect=2,
+        read=0,
+        backoff_factor=0.1,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset(["GET", "HEAD", "PUT", "DELETE"]),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, pool_block=False,
+                          max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared session so all test cases reuse pooled connections
+http_session = create_http_session()
+
+# (connect, read) timeouts: fail fast on a dead socket, still allow slow handlers
+REQUEST_TIMEOUT = (3.05, 30)
+
+# Opt-in record/replay of API responses for local dev loops
+ENABLE_RESPONSE_CACHE = os.getenv("AERUGO_TEST_CACHE") == "1"
+RESPONSE_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".response_cache")
+
+
+class CachedResponse:
+    """Minimal stand-in for requests.Response replayed from the response cache"""
+    
+    def __init__(self, status_code: int, content: bytes):
+        self.status_code = status_code
+        self.content = content
+        self.text = content.decode("utf-8", errors="replace")
+    
+    def json(self):
+        return json.loads(self.content)
+
+
+class ResponseCache:
+    """On-disk response cache keyed by request and its occurrence within the run"""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.Lock()
+        self.occurrences = {}
+    
+    def key(self, method: str, url: str, data: Optional[Dict], token: Optional[str]) -> str:
+        raw = "|".join([method, url, json.dumps(data, sort_keys=True), token or ""])
+        digest = hashlib.sha256(raw.encode()).hexdigest()
+        # Repeated identical requests (e.g. duplicate adds) get their own entries
+        with self.lock:
+            occurrence = self.occurrences.get(digest, 0)
+            self.occurrences[digest] = occurrence + 1
+        return f"{digest}:{occurrence}"
+    
+    def run_id(self) -> str:
+        """Id of the recording held in this cache, created when recording starts
+        
+        Test names are derived from it, so a replay repeats the recorded request
+        bodies while a fresh recording (after deleting the cache) uses new names.
+        """
+        with self.lock, shelve.open(self.path) as db:
+            if "run_id" not in db:
+                db["run_id"] = secrets.token_hex(8)
+            return db["run_id"]
+    
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self.lock, shelve.open(self.path) as db:
+            entry = db.get(key)
+        return CachedResponse(*entry) if entry else None
+    
+    def put(self, key: str, response: requests.Response):
+        with self.lock, shelve.open(self.path) as db:
+            db[key] = (response.status_code, response.content)
+
+
+response_cache = ResponseCache(RESPONSE_CACHE_PATH) if ENABLE_RESPONSE_CACHE else None
+RECORDING_RUN_ID = response_cache.run_id() if response_cache is not None else None
+
+
+# Marks a response whose JSON body hasn't been parsed yet (a JSON null parses to None)
+_UNSET = object()
+
+
+def fanout_workers(workers: int) -> int:
+    """Thread pool size for concurrent test work; 1 while recording/replaying responses"""
+    return 1 if ENABLE_RESPONSE_CACHE else workers
+
+
+@lru_cache(maxsize=256)
+def api_url(endpoint: str) -> str:
+    """Resolve an endpoint path (or absolute URL) to a full API URL"""
+    if endpoint.startswith('/'):
+        return f"{API_BASE}{endpoint}"
+    if endpoint.startswith('http'):
+        return endpoint
+    return f"{API_BASE}/{endpoint}"
+
+
+@lru_cache(maxsize=256)
+def default_headers(token: Optional[str] = None) -> Dict[str, str]:
+    """JSON request headers for a bearer token (shared dict, do not mutate)"""
+    request_headers = {"Content-Type": "application/json"}
+    if token:
+        request_headers["Authorization"] = f"Bearer {token}"
+    return request_headers
+
+
 class BaseTestCase:
     """Base class for integration tests with common utilities"""
     
+    # Parsed /auth/me bodies keyed by token (a token always maps to the same user)
+    _current_user_cache: Dict[str, dict] = {}
+    
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.session = http_session
     
     def make_request(self, method: str, endpoint: str, data: Optional[Dict] = None,
                     headers: Optional[Dict] = None, token: Optional[str] = None,
                     expected_status: Optional[int] = None) -> requests.Response:
         """Make HTTP request to the API"""
-        if endpoint.startswith('/'):
-            url = f"{API_BASE}{endpoint}"
-        elif endpoint.startswith('http'):
-            url = endpoint
-        else:
-            url = f"{API_BASE}/{endpoint}"
+        url = api_url(endpoint)
         
-        request_headers = {"Content-Type": "application/json"}
         if headers:
-            request_headers.update(headers)
-        if token:
-            request_headers["Authorization"] = f"Bearer {token}"
+            request_headers = {"Content-Type": "application/json", **headers}
+            if token:
+                request_headers["Authorization"] = f"Bearer {token}"
+        else:
+            request_headers = default_headers(token)
+        
+        self.logger.debug("%s %s - Data: %s", method, url, data)
         
-        self.logger.debug(f"{method} {url} - Data: {data}")
+        cache_key = None
+        if response_cache is not None:
+            cache_key = response_cache.key(method, url, data, token)
+            cached = response_cache.get(cache_key)
+            if cached is not None:
+                self.logger.debug("Replayed cached response: %s", cached.status_code)
+                return cached
         
-        response = requests.request(
+        # Serialize bodies with orjson when available (Content-Type is already JSON)
+        if orjson is not None and data is not None:
+            body = {"data": orjson.dumps(data)}
+        else:
+            body = {"json": data}
+        
+        response = self.session.request(
             method=method,
             url=url,
-            json=data,
             headers=request_headers,
-            timeout=30
+            timeout=REQUEST_TIMEOUT,
+            **body
         )
         
-        self.logger.debug(f"Response: {response.status_code} - {response.text[:500]}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Response: %s - %s", response.status_code, response.text[:500])
+        
+        if cache_key is not None:
+            response_cache.put(cache_key, response)
         
         if expected_status and response.status_code != expected_status:
             self.logger.error(f"Expected status {expected_status}, got {response.status_code}")
@@ -64,6 +210,48 @@ class BaseTestCase:
             
         return response
     
+    def parse_json(self, response: requests.Response):
+        """Parse a JSON response body once, reusing the result on later calls"""
+        parsed = getattr(response, "_parsed_json", _UNSET)
+        if parsed is _UNSET:
+            parsed = orjson.loads(response.content) if orjson else response.json()
+            response._parsed_json = parsed
+        return parsed
+    
+    def parse_payload(self, response: requests.Response, key: str,
+                      required_fields: Sequence[str] = ()) -> Any:
+        """Parse a JSON response and return its `key` object after checking required fields"""
+        data = self.parse_json(response)
+        self.verify_json_structure(data, [key])
+        payload = data[key]
+        self.verify_json_structure(payload, required_fields)
+        return payload
+    
+    def fetch_current_user(self, token: str) -> dict:
+        """GET /auth/me for a token, reusing the parsed body on later calls"""
+        user_info = BaseTestCase._current_user_cache.get(token)
+        if user_info is None:
+            response = self.make_request("GET", "/auth/me", token=token)
+            self.assert_response(response, 200, "Failed to fetch current user")
+            user_info = self.parse_json(response)
+            self.verify_json_structure(user_info, ["id", "username", "email"])
+            BaseTestCase._current_user_cache[token] = user_info
+        return user_info
+    
+    def make_requests_parallel(self, specs: List[tuple]) -> List[requests.Response]:
+        """Make independent HTTP requests concurrently over the shared session
+        
+        Each spec is a (method, endpoint, data, token) tuple; responses are
+        returned in spec order. With the response cache enabled they are sent one
+        at a time, in spec order, so cache keys match between record and replay.
+        """
+        with ThreadPoolExecutor(max_workers=fanout_workers(min(len(specs), 8) or 1)) as executor:
+            futures = [
+                executor.submit(self.make_request, method, endpoint, data, token=token)
+                for method, endpoint, data, token in specs
+            ]
+            return [future.result() for future in futures]
+    
     def assert_response(self, response: requests.Response, expected_status: int, message: str = ""):
         """Assert response status code"""
         if response.status_code != expected_status:
@@ -71,13 +259,26 @@ class BaseTestCase:
             self.logger.error(error_msg)
             raise AssertionError(error_msg)
     
+    def assert_equal(self, actual: Any, expected: Any, message: str = ""):
+        """Assert two values are equal (kept under python -O, unlike assert)"""
+        if actual != expected:
+            error_msg = f"{message}: Expected {expected!r}, got {actual!r}"
+            self.logger.error(error_msg)
+            raise AssertionError(error_msg)
+    
+    def assert_true(self, condition: Any, message: str = ""):
+        """Assert a condition holds (kept under python -O, unlike assert)"""
+        if not condition:
+            self.logger.error(message)
+            raise AssertionError(message)
+    
     def wait_for_service(self, url: str, timeout: int = 30, interval: int = 2) -> bool:
         """Wait for a service to become available"""
         self.logger.info(f"Waiting for service at {url}...")
         
         for attempt in range(timeout // interval):
             try:
-                response = requests.get(url, timeout=5)
+                response = self.session.get(url, timeout=5)
                 if response.status_code == 200:
                     self.logger.info(f"✅ Service at {url} is available")
                     return True
@@ -174,7 +375,7 @@ class BaseTestCase:
         })
         self.assert_response(login_response, 200, "User login failed")
         
-        login_data = login_response.json()
+        login_data = self.parse_json(login_response)
         user_data["token"] = login_data["token"]
         
         return user_data
@@ -184,7 +385,7 @@ class BaseTestCase:
         response = self.make_request("POST", "/orgs", org_data, token=owner_token)
         self.assert_response(response, 201, "Organization creation failed")
         
-        created_org = response.json()
+        created_org = self.parse_json(response)
         org_data.update(created_org)
         
         return org_data
@@ -232,11 +433,13 @@ class TestDataManager:
             
             cursor.execute("""
                 DELETE FROM organizations WHERE name LIKE 'testorg_%'
+                OR name LIKE 'repoorg_%'
                 OR display_name LIKE 'Test Organization %'
             """)
             
             cursor.execute("""
                 DELETE FROM repositories WHERE name LIKE 'testrepo_%'
+                OR name LIKE 'longrepo_%'
                 OR description LIKE 'Test repository %'
             """)
             
@@ -6,8 +6,7 @@ import sys
 import os
 import pytest
 import time
-import random
-import string
+import secrets
 
 # Add tests directory to Python path
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -32,13 +31,33 @@ def setup_test_environment():
         sys.path.insert(0, test_dir)
     
     # Generate unique test session ID to avoid conflicts
-    session_id = ''.join(random.choices(string.ascii_lowercase + string.digits, k=8))
+    session_id = secrets.token_hex(4)
     os.environ['TEST_SESSION_ID'] = session_id
     print(f"Test session ID: {session_id}")
     
     yield
     
     print("\n🧹 Cleaning up test environment...")
+    try:
+        from base_test import http_session
+        http_session.close()
+    except ImportError:
+        pass
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_connection():
+    """
+    Open a pooled connection to the server once per session (per xdist worker)
+    """
+    try:
+        from base_test import http_session
+        from config import SERVER_URL
+        http_session.get(f"{SERVER_URL}/health", timeout=5)
+    except Exception:
+        # Server may be down (mock mode); tests report that themselves
+        pass
+    
+    yield
 
 @pytest.fixture(scope="function", autouse=True)  
 def reset_test_data():
@@ -76,7 +95,7 @@ def fresh_test_user():
     Create a fresh test user for each test
     """
     session_id = os.environ.get('TEST_SESSION_ID', 'default')
-    test_id = ''.join(random.choices(string.ascii_lowercase + string.digits, k=6))
+    test_id = secrets.token_hex(3)
     
     return {
         'username': f'testuser_{session_id}_{test_id}',
@@ -91,7 +110,7 @@ def fresh_test_org():
     Create a fresh test organization for each test
     """
     session_id = os.environ.get('TEST_SESSION_ID', 'default')
-    test_id = ''.join(random.choices(string.ascii_lowercase + string.digits, k=6))
+    test_id = secrets.token_hex(3)
     
     return {
         'name': f'testorg_{session_id}_{test_id}',
@@ -114,6 +133,9 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "requires_services: mark test as requiring external services"
     )
+    # Recorded responses are matched by request order, so replay needs one process
+    if os.getenv("AERUGO_TEST_CACHE") == "1" and config.getoption("numprocesses", None):
+        raise pytest.UsageError("AERUGO_TEST_CACHE=1 requires a serial run; drop -n")
 
 def pytest_collection_modifyitems(config, items):
     """Modify test collection"""
@@ -17,25 +17,19 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from test_auth import AuthTests
 from test_organizations import OrganizationTests  
 from test_users import UserTests
-from test_repositories import RepositoryTests
+from test_repositories import RepositoryTests, REPO_CREATION_CASES
 
 # Global test instances - will be recreated for each test run
 auth_tests = None
-org_tests = None
-user_tests = None
-repo_tests = None
 
 def setup_module():
     """Setup test instances - called once per module"""
-    global auth_tests, org_tests, user_tests, repo_tests
+    global auth_tests
     
     print("\n🔧 Setting up test instances...")
     
     # Create fresh instances for each test run
     auth_tests = AuthTests()
-    org_tests = OrganizationTests()
-    user_tests = UserTests()
-    repo_tests = RepositoryTests()
     
     print("✅ Test instances ready")
 
@@ -123,87 +117,100 @@ def test_rapid_consecutive_registrations():
     auth_tests.test_rapid_consecutive_registrations()
 
 # Organization Tests  
-def test_organization_creation():
+@pytest.fixture(name="org_tests")
+def fresh_org_tests():
+    """Fresh OrganizationTests per test so xdist workers share no state"""
+    return OrganizationTests()
+
+def test_organization_creation(org_tests):
     org_tests.test_organization_creation()
 
-def test_organization_long_names():
+def test_organization_long_names(org_tests):
     org_tests.test_organization_long_names()    
     
-def test_list_organizations():
+def test_list_organizations(org_tests):
     org_tests.test_list_organizations() 
 
-def test_get_organization():
+def test_get_organization(org_tests):
     org_tests.test_get_organization() 
 
-def test_update_organization():
+def test_update_organization(org_tests):
     org_tests.test_update_organization() 
 
-def test_delete_organization():
+def test_delete_organization(org_tests):
     org_tests.test_delete_organization() 
 
-def test_add_organization_member():
+def test_add_organization_member(org_tests):
     org_tests.test_add_organization_member() 
 
-def test_get_organization_members():
+def test_get_organization_members(org_tests):
     org_tests.test_get_organization_members() 
 
-def test_update_member_role():
+def test_update_member_role(org_tests):
     org_tests.test_update_member_role() 
 
-def test_remove_organization_member():
+def test_remove_organization_member(org_tests):
     org_tests.test_remove_organization_member() 
 
-def test_organization_permissions():
+def test_organization_permissions(org_tests):
     org_tests.test_organization_permissions()     
 
 # User Tests
-def test_user_profile_retrieval():
+@pytest.fixture(name="user_tests")
+def fresh_user_tests():
+    """Fresh UserTests per test; the registered user itself is shared per worker process"""
+    return UserTests()
+
+def test_user_profile_retrieval(user_tests):
     user_tests.test_user_profile_retrieval()
 
-def test_user_profile_update():
+def test_user_profile_update(user_tests):
     user_tests.test_user_profile_update()
 
-def test_user_public_profile():
+def test_user_public_profile(user_tests):
     user_tests.test_user_public_profile()
 
-def test_user_search():
+def test_user_search(user_tests):
     user_tests.test_user_search()
 
-def test_user_avatar_upload():
+def test_user_avatar_upload(user_tests):
     user_tests.test_user_avatar_upload()
 
-def test_user_password_change():
+def test_user_password_change(user_tests):
     user_tests.test_user_password_change()
 
-def test_user_account_deletion():
+def test_user_account_deletion(user_tests):
     user_tests.test_user_account_deletion()
 
-def test_user_email_verification():
+def test_user_email_verification(user_tests):
     user_tests.test_user_email_verification()
 
-def test_user_preferences():
+def test_user_preferences(user_tests):
     user_tests.test_user_preferences()
 
 # Repository Tests
-def test_repository_creation():
-    repo_tests.test_repository_creation()
+@pytest.fixture(name="repo_tests")
+def fresh_repo_tests():
+    """Fresh RepositoryTests per test so xdist workers share no state"""
+    return RepositoryTests()
 
-def test_repository_long_names():
-    repo_tests.test_repository_long_names()
+@pytest.mark.parametrize("case", list(REPO_CREATION_CASES))
+def test_repository_creation(repo_tests, case):
+    repo_tests.check_repository_creation(case)
 
-def test_list_repositories():
+def test_list_repositories(repo_tests):
     repo_tests.test_list_repositories()
 
-def test_get_repository():
+def test_get_repository(repo_tests):
     repo_tests.test_get_repository()
 
-def test_delete_repository():
+def test_delete_repository(repo_tests):
     repo_tests.test_delete_repository()
 
-# def test_set_repository_permissions():
+# def test_set_repository_permissions(repo_tests):
 #     repo_tests.test_set_repository_permissions()
 
-# def test_repository_permissions():
+# def test_repository_permissions(repo_tests):
 #     repo_tests.test_repository_permissions()
 
 if __name__ == "__main__":
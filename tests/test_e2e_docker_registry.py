@@ -24,6 +24,9 @@ logger = logging.getLogger(__name__)
 REGISTRY_URL = "localhost:8080"
 API_BASE = f"http://{REGISTRY_URL}/api/v1"
 REGISTRY_V2_BASE = f"http://{REGISTRY_URL}/v2"
+# Abort a pull when docker prints no progress for this many seconds; non-TTY
+# pulls stay silent while a single large layer downloads
+PULL_INACTIVITY_TIMEOUT = int(os.getenv("AERUGO_PULL_INACTIVITY_TIMEOUT", "180"))
 
 
 class DockerE2ETester:
@@ -44,8 +47,10 @@ class DockerE2ETester:
         """Cleanup test environment"""
         try:
             # Cleanup docker images
-            self._run_docker_command(["rmi", self.full_image_name], allow_fail=True)
-            self._run_docker_command(["rmi", f"{self.test_image}:{self.test_tag}"], allow_fail=True)
+            self._run_docker_command(["rmi", self.full_image_name], allow_fail=True,
+                                     discard_output=True)
+            self._run_docker_command(["rmi", f"{self.test_image}:{self.test_tag}"], allow_fail=True,
+                                     discard_output=True)
             
             # Cleanup temp directory
             if self.temp_dir and os.path.exists(self.temp_dir):
@@ -84,13 +89,18 @@ class DockerE2ETester:
             logger.error(f"❌ Docker check error: {e}")
             return False
     
-    def _run_docker_command(self, cmd, allow_fail=False, timeout=60):
+    def _run_docker_command(self, cmd, allow_fail=False, timeout=60, discard_output=False):
         """Run a docker command"""
         full_cmd = ["docker"] + cmd
         logger.info(f"Running: {' '.join(full_cmd)}")
         
         try:
-            result = subprocess.run(full_cmd, capture_output=True, text=True, timeout=timeout)
+            if discard_output:
+                # Fire-and-forget calls don't need pipes or decoded output
+                result = subprocess.run(full_cmd, stdout=subprocess.DEVNULL,
+                                        stderr=subprocess.DEVNULL, timeout=timeout)
+            else:
+                result = subprocess.run(full_cmd, capture_output=True, text=True, timeout=timeout)
             if result.returncode != 0 and not allow_fail:
                 logger.error(f"Docker command failed: {result.stderr}")
                 return None
@@ -102,6 +112,49 @@ class DockerE2ETester:
             logger.error(f"Docker command error: {e}")
             return None
     
+    def _run_docker_streaming(self, cmd, inactivity_timeout=PULL_INACTIVITY_TIMEOUT, timeout=300):
+        """Run a docker command, killing it if its output stalls"""
+        full_cmd = ["docker"] + cmd
+        logger.info(f"Running: {' '.join(full_cmd)}")
+        
+        try:
+            process = subprocess.Popen(full_cmd, stdout=subprocess.PIPE,
+                                       stderr=subprocess.STDOUT, text=True)
+        except Exception as e:
+            logger.error(f"Docker command error: {e}")
+            return None
+        
+        started = last_progress = time.monotonic()
+        stalled = threading.Event()
+        
+        def watchdog():
+            while process.poll() is None:
+                now = time.monotonic()
+                if now - last_progress > inactivity_timeout or now - started > timeout:
+                    stalled.set()
+                    process.kill()
+                    return
+                time.sleep(1)
+        
+        threading.Thread(target=watchdog, daemon=True).start()
+        
+        output = []
+        for line in process.stdout:
+            last_progress = time.monotonic()
+            output.append(line)
+            logger.debug(line.rstrip())
+        process.wait()
+        
+        if stalled.is_set():
+            logger.error(f"Docker command stalled: {' '.join(full_cmd)}")
+            return None
+        
+        result = subprocess.CompletedProcess(full_cmd, process.returncode, "".join(output), "")
+        if result.returncode != 0:
+            logger.error(f"Docker command failed: {result.stdout}")
+            return None
+        return result
+    
     def create_test_dockerfile(self):
         """Create a simple test Dockerfile"""
         dockerfile_content = """FROM alpine:latest
@@ -241,12 +294,13 @@ CMD ["cat", "/hello.txt"]
         
         try:
             # Remove local image first
-            self._run_docker_command(["rmi", self.full_image_name], allow_fail=True)
+            self._run_docker_command(["rmi", self.full_image_name], allow_fail=True,
+                                     discard_output=True)
             
-            # Pull the image
-            result = self._run_docker_command([
+            # Pull the image, failing fast if layer progress stalls
+            result = self._run_docker_streaming([
                 "pull", self.full_image_name
-            ], timeout=300)  # 5 minute timeout for pull
+            ], timeout=300)  # 5 minute overall cap for pull
             
             if result and result.returncode == 0:
                 logger.info("✓ Docker pull successful")
@@ -332,23 +386,24 @@ CMD ["cat", "/hello.txt"]
         """Run comprehensive end-to-end test"""
         logger.info("🚀 Starting comprehensive Docker Registry E2E tests...")
         
+        # (name, func, is_prereq) - a failing prerequisite stops the run
         tests = [
-            ("Server Health Check", self.check_server_health),
-            ("Docker Available Check", self.check_docker_available),
-            ("Registry V2 API Test", self.test_registry_v2_api),
-            ("Docker Build Test Image", self.test_docker_build_image),
-            ("Docker Tag for Registry", self.test_docker_tag_image),
-            ("Docker Push Test", self.test_docker_push),
-            ("Registry API Content Check", self.check_registry_contents_via_api),
-            ("Docker Pull Test", self.test_docker_pull),
-            ("Docker Run Pulled Image", self.test_docker_run_pulled_image),
+            ("Server Health Check", self.check_server_health, True),
+            ("Docker Available Check", self.check_docker_available, True),
+            ("Registry V2 API Test", self.test_registry_v2_api, False),
+            ("Docker Build Test Image", self.test_docker_build_image, False),
+            ("Docker Tag for Registry", self.test_docker_tag_image, False),
+            ("Docker Push Test", self.test_docker_push, False),
+            ("Registry API Content Check", self.check_registry_contents_via_api, False),
+            ("Docker Pull Test", self.test_docker_pull, False),
+            ("Docker Run Pulled Image", self.test_docker_run_pulled_image, False),
         ]
         
         results = []
         passed = 0
         total = len(tests)
         
-        for test_name, test_func in tests:
+        for index, (test_name, test_func, is_prereq) in enumerate(tests):
             logger.info(f"\n{'='*60}")
             logger.info(f"Running: {test_name}")
             logger.info(f"{'='*60}")
@@ -363,7 +418,13 @@ CMD ["cat", "/hello.txt"]
                     logger.error(f"❌ {test_name}: FAILED")
             except Exception as e:
                 logger.error(f"💥 {test_name}: ERROR - {e}")
+                result = False
                 results.append((test_name, False))
+            
+            if is_prereq and not result:
+                logger.error(f"⛔ Prerequisite '{test_name}' failed, skipping remaining tests")
+                results.extend((name, None) for name, _, _ in tests[index + 1:])
+                break
         
         # Print summary
         logger.info(f"\n{'='*60}")
@@ -371,11 +432,16 @@ CMD ["cat", "/hello.txt"]
         logger.info(f"{'='*60}")
         logger.info(f"Total Tests: {total}")
         logger.info(f"Passed: {passed}")
-        logger.info(f"Failed: {total - passed}")
+        skipped = sum(1 for _, result in results if result is None)
+        logger.info(f"Failed: {total - passed - skipped}")
+        logger.info(f"Skipped: {skipped}")
         logger.info(f"Success Rate: {(passed/total)*100:.1f}%")
         
         for test_name, result in results:
-            status = "✅ PASS" if result else "❌ FAIL"
+            if result is None:
+                status = "⏭️ SKIPPED"
+            else:
+                status = "✅ PASS" if result else "❌ FAIL"
             logger.info(f"{status}: {test_name}")
         
         return passed == total
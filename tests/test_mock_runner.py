@@ -5,6 +5,7 @@ This ensures tests pass even when server cannot start
 """
 
 import sys
+import re
 import logging
 import requests
 import hashlib
@@ -16,6 +17,10 @@ from pathlib import Path
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Precompiled validation patterns
+_ORG_RE = re.compile(r"^[A-Za-z0-9_-]+$")
+_DIGEST_RE = re.compile(r"^sha256:[0-9a-f]+$")
+
 class MockTestRunner:
     """Mock test runner that validates functionality without requiring server"""
     
@@ -88,7 +93,7 @@ class MockTestRunner:
         # Validate organization data
         assert "name" in org_data, "Organization should have name"
         assert len(org_data["name"]) >= 3, "Organization name should be at least 3 chars"
-        assert org_data["name"].replace("-", "").replace("_", "").isalnum(), "Org name should be alphanumeric"
+        assert _ORG_RE.fullmatch(org_data["name"]), "Org name should be alphanumeric"
         
         logger.info("✓ Organization mock validation passed")
         return True
@@ -121,9 +126,8 @@ class MockTestRunner:
         # Mock Docker operations
         docker_operations = ["push", "pull", "build", "tag", "delete"]
         
-        for operation in docker_operations:
-            assert isinstance(operation, str), f"Docker operation {operation} should be string"
-            assert len(operation) > 0, f"Docker operation {operation} should not be empty"
+        assert all(isinstance(op, str) and op for op in docker_operations), \
+            "Docker operations should be non-empty strings"
         
         # Mock image metadata
         image_metadata = {
@@ -136,7 +140,7 @@ class MockTestRunner:
         
         assert "repository" in image_metadata, "Image should have repository"
         assert "digest" in image_metadata, "Image should have digest"
-        assert image_metadata["digest"].startswith("sha256:"), "Digest should be SHA256"
+        assert _DIGEST_RE.match(image_metadata["digest"]), "Digest should be SHA256"
         
         logger.info("✓ Docker registry mock validation passed")
         return True
@@ -5,39 +5,143 @@ Converted from test_storage.rs to test storage operations via HTTP APIs
 """
 
 import requests
-import tempfile
+from requests.adapters import HTTPAdapter
+import io
 import hashlib
 import logging
-import os
+import socket
 import sys
 import time
 import json
 import pytest
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import urlparse
+from typing import Any, ClassVar, Dict, Iterable, Iterator, Optional
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Optional faster JSON decoder
+    orjson = None
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def repeated_chunks(pattern: bytes, size: int, chunk_size: int = 64 * 1024) -> Iterator[memoryview]:
+    """Yield `size` bytes of `pattern` repeated, as views over a single chunk-sized buffer"""
+    buf = memoryview(pattern * (chunk_size // len(pattern)))
+    for offset in range(0, size, len(buf)):
+        yield buf[:min(len(buf), size - offset)]
+
+# (connect, read) timeouts: a dead server fails within a second instead of the full read timeout
+PROBE_TIMEOUT = (1.0, 5.0)
+API_TIMEOUT = (1.0, 10.0)
+
 class StorageAPITester:
     """Test class for storage operations via HTTP API"""
     
+    # Fixture payloads shared by the live and mock paths, built once at import
+    _CONCURRENT_PAYLOADS: ClassVar[tuple[bytes, ...]] = tuple(f"Content {i}".encode() for i in range(5))
+    _CONCURRENT_DIGESTS: ClassVar[tuple[str, ...]] = tuple(
+        f"sha256:{hashlib.sha256(payload).hexdigest()}" for payload in _CONCURRENT_PAYLOADS
+    )
+    _CONTENT_TYPE_CASES: ClassVar[tuple[tuple[bytes, str], ...]] = (
+        (b"Text content", "text/plain"),
+        (b"\x89PNG\r\n\x1a\n", "image/png"),  # PNG header
+        (b"Binary\x00\x01\x02\x03", "application/octet-stream"),
+    )
+    
     def __init__(self, base_url: str = "http://localhost:8080"):
         self.base_url = base_url
         self.api_base = f"{base_url}/api/v1"
+        self.health_url = f"{base_url}/health"
+        self.storage_health_url = f"{self.api_base}/storage/health"
+        self.upload_url = f"{self.api_base}/storage/upload"
+        self.stream_upload_url = f"{self.api_base}/storage/stream/upload"
+        # Per-blob endpoints, formatted with the digest
+        self.exists_url = f"{self.api_base}/storage/exists/{{}}"
+        self.download_url = f"{self.api_base}/storage/download/{{}}"
+        self.stream_download_url = f"{self.api_base}/storage/stream/download/{{}}"
+        self.metadata_url = f"{self.api_base}/storage/metadata/{{}}"
+        self.delete_url = f"{self.api_base}/storage/delete/{{}}"
+        self._server_up: Optional[bool] = None
+        
+        # Keep-alive session shared by every API call (and by worker threads)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+    def close(self):
+        """Release pooled HTTP connections"""
+        self.session.close()
         
     def check_server_running(self) -> bool:
-        """Check if server is running"""
+        """Check if server is running (probed once per tester)"""
+        if self._server_up is None:
+            self._server_up = self._port_open() and self._health_ok()
+        return self._server_up
+    
+    def _port_open(self) -> bool:
+        """Plain TCP connect to the server port; fails in milliseconds when nothing listens"""
+        url = urlparse(self.base_url)
+        port = url.port or (443 if url.scheme == "https" else 80)
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.5)
+            try:
+                return sock.connect_ex((url.hostname, port)) == 0
+            except OSError:
+                return False
+    
+    def _health_ok(self) -> bool:
+        """HEAD /health (axum answers HEAD on GET routes without a body)"""
         try:
-            response = requests.get(f"{self.base_url}/health", timeout=5)
+            response = self.session.head(self.health_url, timeout=PROBE_TIMEOUT)
             return response.status_code == 200
-        except:
+        except requests.RequestException:
             return False
     
-    def calculate_digest(self, data: bytes) -> str:
-        """Calculate SHA256 digest for data"""
-        return f"sha256:{hashlib.sha256(data).hexdigest()}"
+    @staticmethod
+    def _json(response: requests.Response) -> Any:
+        """Decode a JSON response body, with orjson when available"""
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+    
+    @staticmethod
+    def _require(condition: bool, message: str) -> None:
+        """Fail with AssertionError; unlike `assert`, this survives `python -O`"""
+        if not condition:
+            raise AssertionError(message)
+    
+    def _require_body(self, response: requests.Response, expected: bytes, expected_digest: str, message: str) -> None:
+        """Verify a streamed response body by size and sha256 without buffering it"""
+        digest = hashlib.sha256()
+        received = 0
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            digest.update(chunk)
+            received += len(chunk)
+        self._require(received == len(expected), f"{message} (got {received} bytes, expected {len(expected)})")
+        self._require(f"sha256:{digest.hexdigest()}" == expected_digest, message)
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def calculate_digest(data: bytes, algorithm: str = "sha256") -> str:
+        """Calculate an `algorithm:hex` digest for data (memoized; the test payloads are constants)
+        
+        The server only accepts sha256; other hashlib algorithms are for mock-only checks.
+        """
+        return f"{algorithm}:{hashlib.new(algorithm, data).hexdigest()}"
+    
+    @staticmethod
+    def calculate_digest_stream(chunks: Iterable[bytes]) -> str:
+        """Calculate SHA256 digest incrementally over an iterable of chunks"""
+        digest = hashlib.sha256()
+        for chunk in chunks:
+            digest.update(chunk)
+        return f"sha256:{digest.hexdigest()}"
     
     # Basic blob operations tests
     def test_basic_blob_operations(self) -> bool:
@@ -49,92 +153,74 @@ class StorageAPITester:
             test_digest = self.calculate_digest(test_content)
             
             # Test put_blob via upload API
-            logger.info(f"Testing blob upload with digest: {test_digest}")
+            logger.info("Testing blob upload with digest: %s", test_digest)
             
-            # Create a temporary file
-            with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-                tmp_file.write(test_content)
-                tmp_file_path = tmp_file.name
+            # Upload blob (simulate put_blob)
+            response = self.session.post(
+                self.upload_url,
+                files={'file': ('blob', io.BytesIO(test_content), 'application/octet-stream')},
+                data={'digest': test_digest},
+                timeout=API_TIMEOUT
+            )
             
-            try:
-                # Upload blob (simulate put_blob)
-                with open(tmp_file_path, 'rb') as f:
-                    files = {'file': f}
-                    data = {'digest': test_digest}
-                    response = requests.post(
-                        f"{self.api_base}/storage/upload",
-                        files=files,
-                        data=data,
-                        timeout=10
-                    )
-                
-                if response.status_code not in [200, 201]:
-                    logger.info(f"Upload API not available or failed: {response.status_code}")
-                    return self._test_blob_operations_mock(test_content, test_digest)
-                
-                # Test blob_exists
-                response = requests.get(
-                    f"{self.api_base}/storage/exists/{test_digest}",
-                    timeout=10
-                )
-                
+            if response.status_code not in [200, 201]:
+                logger.info("Upload API not available or failed: %s", response.status_code)
+                return self._test_blob_operations_mock(test_content, test_digest)
+            
+            def check_exists():
+                response = self.session.get(self.exists_url.format(test_digest), timeout=API_TIMEOUT)
                 if response.status_code == 200:
-                    exists_result = response.json()
-                    assert exists_result.get("exists") is True, "Blob should exist after upload"
+                    exists_result = self._json(response)
+                    self._require(exists_result.get("exists") is True, "Blob should exist after upload")
                     logger.info("✓ Blob exists check passed")
-                
-                # Test get_blob
-                response = requests.get(
-                    f"{self.api_base}/storage/download/{test_digest}",
-                    timeout=10
-                )
-                
-                if response.status_code == 200:
-                    downloaded_content = response.content
-                    assert downloaded_content == test_content, "Downloaded content should match uploaded content"
-                    logger.info("✓ Blob download passed")
-                
-                # Test get_blob_metadata
-                response = requests.get(
-                    f"{self.api_base}/storage/metadata/{test_digest}",
-                    timeout=10
-                )
-                
+            
+            def check_download():
+                with self.session.get(
+                    self.download_url.format(test_digest), stream=True, timeout=API_TIMEOUT
+                ) as response:
+                    if response.status_code == 200:
+                        self._require_body(response, test_content, test_digest, "Downloaded content should match uploaded content")
+                        logger.info("✓ Blob download passed")
+            
+            def check_metadata():
+                response = self.session.get(self.metadata_url.format(test_digest), timeout=API_TIMEOUT)
                 if response.status_code == 200:
-                    metadata = response.json()
-                    assert metadata.get("size") == len(test_content), "Metadata size should match content size"
-                    assert metadata.get("digest") == test_digest, "Metadata digest should match"
+                    metadata = self._json(response)
+                    self._require(metadata.get("size") == len(test_content), "Metadata size should match content size")
+                    self._require(metadata.get("digest") == test_digest, "Metadata digest should match")
                     logger.info("✓ Blob metadata check passed")
-                
-                # Test delete_blob
-                response = requests.delete(
-                    f"{self.api_base}/storage/delete/{test_digest}",
-                    timeout=10
-                )
-                
-                if response.status_code in [200, 204]:
-                    logger.info("✓ Blob deletion passed")
-                
-                # Verify blob no longer exists
-                response = requests.get(
-                    f"{self.api_base}/storage/exists/{test_digest}",
-                    timeout=10
-                )
-                
-                if response.status_code == 200:
-                    exists_result = response.json()
-                    assert exists_result.get("exists") is False, "Blob should not exist after deletion"
-                    logger.info("✓ Blob deletion verification passed")
-                
-                return True
-                
-            finally:
-                # Cleanup temporary file
-                if os.path.exists(tmp_file_path):
-                    os.unlink(tmp_file_path)
-                    
+            
+            # Test blob_exists, get_blob and get_blob_metadata; all only depend on the upload
+            read_steps = [check_exists, check_download, check_metadata]
+            
+            with ThreadPoolExecutor(max_workers=len(read_steps)) as executor:
+                for future in [executor.submit(step) for step in read_steps]:
+                    future.result()  # re-raises the first failed check
+            
+            # Test delete_blob
+            response = self.session.delete(
+                self.delete_url.format(test_digest),
+                timeout=API_TIMEOUT
+            )
+            
+            if response.status_code in [200, 204]:
+                logger.info("✓ Blob deletion passed")
+            
+            # Verify blob no longer exists
+            response = self.session.get(
+                self.exists_url.format(test_digest),
+                timeout=API_TIMEOUT
+            )
+            
+            if response.status_code == 200:
+                exists_result = self._json(response)
+                self._require(exists_result.get("exists") is False, "Blob should not exist after deletion")
+                logger.info("✓ Blob deletion verification passed")
+            
+            return True
+            
         except Exception as e:
-            logger.error(f"Basic blob operations test failed: {e}")
+            logger.error("Basic blob operations test failed: %s", e)
             return False
     
     def _test_blob_operations_mock(self, test_content: bytes, test_digest: str) -> bool:
@@ -143,11 +229,11 @@ class StorageAPITester:
         
         # Validate digest calculation
         expected_digest = self.calculate_digest(test_content)
-        assert expected_digest == test_digest, "Digest calculation should be consistent"
+        self._require(expected_digest == test_digest, "Digest calculation should be consistent")
         
         # Validate content properties
-        assert len(test_content) > 0, "Content should not be empty"
-        assert isinstance(test_content, bytes), "Content should be bytes"
+        self._require(len(test_content) > 0, "Content should not be empty")
+        self._require(isinstance(test_content, bytes), "Content should be bytes")
         
         logger.info("✓ Mock blob operations validation passed")
         return True
@@ -160,51 +246,34 @@ class StorageAPITester:
             test_content = b"Hello from stream! This is a larger content for streaming test."
             test_digest = self.calculate_digest(test_content)
             
-            # Create temporary file for streaming
-            with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-                tmp_file.write(test_content)
-                tmp_file_path = tmp_file.name
+            # Test streaming upload
+            response = self.session.post(
+                self.stream_upload_url,
+                data=test_content,
+                headers={
+                    'Content-Type': 'application/octet-stream',
+                    'X-Digest': test_digest,
+                },
+                timeout=API_TIMEOUT
+            )
             
-            try:
-                # Test streaming upload
-                with open(tmp_file_path, 'rb') as f:
-                    response = requests.post(
-                        f"{self.api_base}/storage/stream/upload",
-                        data=f,
-                        headers={
-                            'Content-Type': 'application/octet-stream',
-                            'X-Digest': test_digest,
-                            'Content-Length': str(len(test_content))
-                        },
-                        timeout=10
-                    )
-                
-                if response.status_code not in [200, 201]:
-                    logger.info(f"Streaming upload API not available: {response.status_code}")
-                    return self._test_streaming_mock(test_content)
-                
-                # Test streaming download
-                response = requests.get(
-                    f"{self.api_base}/storage/stream/download/{test_digest}",
-                    stream=True,
-                    timeout=10
-                )
-                
+            if response.status_code not in [200, 201]:
+                logger.info("Streaming upload API not available: %s", response.status_code)
+                return self._test_streaming_mock(test_content)
+            
+            # Test streaming download
+            with self.session.get(
+                self.stream_download_url.format(test_digest),
+                stream=True,
+                timeout=API_TIMEOUT
+            ) as response:
                 if response.status_code == 200:
-                    downloaded_content = b""
-                    for chunk in response.iter_content(chunk_size=1024):
-                        downloaded_content += chunk
-                    
-                    assert downloaded_content == test_content, "Streamed content should match original"
+                    self._require_body(response, test_content, test_digest, "Streamed content should match original")
                     logger.info("✓ Streaming operations passed")
                     return True
-                
-            finally:
-                if os.path.exists(tmp_file_path):
-                    os.unlink(tmp_file_path)
-                    
+            
         except Exception as e:
-            logger.error(f"Streaming operations test failed: {e}")
+            logger.error("Streaming operations test failed: %s", e)
             return False
         
         return self._test_streaming_mock(test_content)
@@ -215,11 +284,12 @@ class StorageAPITester:
         
         # Simulate streaming by chunking content
         chunk_size = 1024
-        chunks = [test_content[i:i+chunk_size] for i in range(0, len(test_content), chunk_size)]
+        view = memoryview(test_content)  # zero-copy slices; bytes.join accepts them directly
+        chunks = [view[i:i+chunk_size] for i in range(0, len(view), chunk_size)]
         
         # Reassemble chunks
         reassembled = b"".join(chunks)
-        assert reassembled == test_content, "Chunked content should reassemble correctly"
+        self._require(reassembled == test_content, "Chunked content should reassemble correctly")
         
         logger.info("✓ Mock streaming operations validation passed")
         return True
@@ -229,56 +299,45 @@ class StorageAPITester:
         logger.info("Testing concurrent access simulation...")
         
         try:
-            num_operations = 5
-            test_contents = [f"Content {i}".encode() for i in range(num_operations)]
-            test_digests = [self.calculate_digest(content) for content in test_contents]
+            test_contents = self._CONCURRENT_PAYLOADS
+            test_digests = self._CONCURRENT_DIGESTS
+            num_operations = len(test_contents)
             
-            # Simulate concurrent operations by rapid sequential calls
-            upload_results = []
+            def upload_one(content: bytes, digest: str) -> bool:
+                response = self.session.post(
+                    self.upload_url,
+                    files={'file': ('blob', io.BytesIO(content), 'application/octet-stream')},
+                    data={'digest': digest},
+                    timeout=PROBE_TIMEOUT
+                )
+                return response.status_code in [200, 201]
             
-            for i, (content, digest) in enumerate(zip(test_contents, test_digests)):
-                with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-                    tmp_file.write(content)
-                    tmp_file_path = tmp_file.name
-                
-                try:
-                    with open(tmp_file_path, 'rb') as f:
-                        files = {'file': f}
-                        data = {'digest': digest}
-                        response = requests.post(
-                            f"{self.api_base}/storage/upload",
-                            files=files,
-                            data=data,
-                            timeout=5
-                        )
-                    
-                    upload_results.append(response.status_code in [200, 201])
-                    
-                finally:
-                    if os.path.exists(tmp_file_path):
-                        os.unlink(tmp_file_path)
-            
-            # If no APIs available, run mock test
-            if not any(upload_results):
+            def exists(digest: str) -> bool:
+                response = self.session.get(
+                    self.exists_url.format(digest),
+                    timeout=PROBE_TIMEOUT
+                )
+                return response.status_code == 200 and self._json(response).get("exists") is True
+            
+            # The first upload doubles as an availability probe; if it fails, don't bother with the rest
+            if not upload_one(test_contents[0], test_digests[0]):
+                logger.info("Upload API not available, skipping remaining concurrent uploads")
                 return self._test_concurrent_mock(test_contents, test_digests)
             
-            # Verify uploads
-            for i, digest in enumerate(test_digests):
-                response = requests.get(
-                    f"{self.api_base}/storage/exists/{digest}",
-                    timeout=5
-                )
+            # Issue the remaining uploads at once so the server sees genuinely concurrent writes
+            with ThreadPoolExecutor(max_workers=num_operations) as executor:
+                list(executor.map(upload_one, test_contents[1:], test_digests[1:]))
                 
-                if response.status_code == 200:
-                    exists_result = response.json()
-                    if exists_result.get("exists"):
-                        logger.info(f"✓ Concurrent upload {i} verified")
+                # Verify uploads
+                for i, found in enumerate(executor.map(exists, test_digests)):
+                    if found:
+                        logger.debug("✓ Concurrent upload %s verified", i)
             
             logger.info("✓ Concurrent access test passed")
             return True
             
         except Exception as e:
-            logger.error(f"Concurrent access test failed: {e}")
+            logger.error("Concurrent access test failed: %s", e)
             return False
     
     def _test_concurrent_mock(self, test_contents: list, test_digests: list) -> bool:
@@ -286,12 +345,12 @@ class StorageAPITester:
         logger.info("Concurrent APIs not available, running mock validation...")
         
         # Validate all digests are unique
-        assert len(set(test_digests)) == len(test_digests), "All digests should be unique"
+        self._require(len(set(test_digests)) == len(test_digests), "All digests should be unique")
         
         # Validate content-digest mapping
         for content, digest in zip(test_contents, test_digests):
             expected_digest = self.calculate_digest(content)
-            assert expected_digest == digest, "Content-digest mapping should be correct"
+            self._require(expected_digest == digest, "Content-digest mapping should be correct")
         
         logger.info("✓ Mock concurrent operations validation passed")
         return True
@@ -303,40 +362,38 @@ class StorageAPITester:
         try:
             nonexistent_digest = "sha256:nonexistent1234567890abcdef"
             
-            # Test getting nonexistent blob
-            response = requests.get(
-                f"{self.api_base}/storage/download/{nonexistent_digest}",
-                timeout=5
-            )
+            # The three probes are independent, so send them concurrently
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                download = executor.submit(
+                    self.session.get, self.download_url.format(nonexistent_digest), timeout=PROBE_TIMEOUT
+                )
+                metadata = executor.submit(
+                    self.session.get, self.metadata_url.format(nonexistent_digest), timeout=PROBE_TIMEOUT
+                )
+                delete = executor.submit(
+                    self.session.delete, self.delete_url.format(nonexistent_digest), timeout=PROBE_TIMEOUT
+                )
             
+            # Test getting nonexistent blob
+            response = download.result()
             if response.status_code == 404:
                 logger.info("✓ Nonexistent blob download returns 404")
             else:
-                logger.info(f"Download API response: {response.status_code}")
+                logger.info("Download API response: %s", response.status_code)
             
             # Test getting nonexistent blob metadata
-            response = requests.get(
-                f"{self.api_base}/storage/metadata/{nonexistent_digest}",
-                timeout=5
-            )
-            
-            if response.status_code == 404:
+            if metadata.result().status_code == 404:
                 logger.info("✓ Nonexistent blob metadata returns 404")
             
             # Test deleting nonexistent blob
-            response = requests.delete(
-                f"{self.api_base}/storage/delete/{nonexistent_digest}",
-                timeout=5
-            )
-            
-            if response.status_code in [404, 204]:
+            if delete.result().status_code in [404, 204]:
                 logger.info("✓ Nonexistent blob deletion handled correctly")
             
             logger.info("✓ Error conditions test passed")
             return True
             
         except Exception as e:
-            logger.error(f"Error conditions test failed: {e}")
+            logger.error("Error conditions test failed: %s", e)
             return False
     
     def test_health_check(self) -> bool:
@@ -344,25 +401,23 @@ class StorageAPITester:
         logger.info("Testing storage health check...")
         
         try:
-            response = requests.get(
-                f"{self.api_base}/storage/health",
-                timeout=5
+            response = self.session.get(
+                self.storage_health_url,
+                timeout=PROBE_TIMEOUT
             )
             
             if response.status_code == 200:
                 logger.info("✓ Storage health check passed")
                 return True
-            else:
-                # Fallback to general health endpoint
-                response = requests.get(f"{self.base_url}/health", timeout=5)
-                if response.status_code == 200:
-                    logger.info("✓ General health check passed (storage-specific not available)")
-                    return True
+            elif self.check_server_running():
+                # Fall back to the general health probe, which run_all_tests has usually already made
+                logger.info("✓ General health check passed (storage-specific not available)")
+                return True
             
             return False
             
         except Exception as e:
-            logger.error(f"Health check test failed: {e}")
+            logger.error("Health check test failed: %s", e)
             return False
     
     def run_all_tests(self) -> tuple[int, int]:
@@ -389,15 +444,15 @@ class StorageAPITester:
         total = len(tests)
         
         for test_name, test_func in tests:
-            logger.info(f"\n--- Testing {test_name} ---")
+            logger.info("\n--- Testing %s ---", test_name)
             try:
                 if test_func():
-                    logger.info(f"✓ {test_name} API OK")
+                    logger.info("✓ %s API OK", test_name)
                     passed += 1
                 else:
-                    logger.info(f"❌ {test_name} API failed")
+                    logger.info("❌ %s API failed", test_name)
             except Exception as e:
-                logger.info(f"❌ {test_name} API error: {e}")
+                logger.info("❌ %s API error: %s", test_name, e)
         
         return passed, total
     
@@ -417,15 +472,15 @@ class StorageAPITester:
         total = len(tests)
         
         for test_name, test_func in tests:
-            logger.info(f"\n--- Testing {test_name} (Mock) ---")
+            logger.info("\n--- Testing %s (Mock) ---", test_name)
             try:
                 if test_func():
-                    logger.info(f"✓ {test_name} validation OK")
+                    logger.info("✓ %s validation OK", test_name)
                     passed += 1
                 else:
-                    logger.info(f"❌ {test_name} validation failed")
+                    logger.info("❌ %s validation failed", test_name)
             except Exception as e:
-                logger.info(f"❌ {test_name} validation error: {e}")
+                logger.info("❌ %s validation error: %s", test_name, e)
         
         return passed, total
     
@@ -436,13 +491,13 @@ class StorageAPITester:
         
         # Validate digest calculation
         expected_digest_parts = test_digest.split(':')
-        assert len(expected_digest_parts) == 2, "Digest should have format 'sha256:hash'"
-        assert expected_digest_parts[0] == "sha256", "Digest should use SHA256"
-        assert len(expected_digest_parts[1]) == 64, "SHA256 hash should be 64 characters"
+        self._require(len(expected_digest_parts) == 2, "Digest should have format 'sha256:hash'")
+        self._require(expected_digest_parts[0] == "sha256", "Digest should use SHA256")
+        self._require(len(expected_digest_parts[1]) == 64, "SHA256 hash should be 64 characters")
         
         # Validate content properties
-        assert len(test_content) > 0, "Content should not be empty"
-        assert isinstance(test_content, bytes), "Content should be bytes type"
+        self._require(len(test_content) > 0, "Content should not be empty")
+        self._require(isinstance(test_content, bytes), "Content should be bytes type")
         
         return True
     
@@ -452,28 +507,29 @@ class StorageAPITester:
         
         # Simulate chunking
         chunk_size = 10
-        chunks = [test_content[i:i+chunk_size] for i in range(0, len(test_content), chunk_size)]
+        view = memoryview(test_content)  # zero-copy slices; bytes.join accepts them directly
+        chunks = [view[i:i+chunk_size] for i in range(0, len(view), chunk_size)]
         
         # Validate chunking works correctly
         reassembled = b"".join(chunks)
-        assert reassembled == test_content, "Chunked content should reassemble correctly"
-        assert len(chunks) > 1, "Should have multiple chunks for streaming"
+        self._require(reassembled == test_content, "Chunked content should reassemble correctly")
+        self._require(len(chunks) > 1, "Should have multiple chunks for streaming")
         
         return True
     
     def _run_mock_concurrent(self) -> bool:
         """Mock test for concurrent operations"""
-        num_operations = 5
-        test_contents = [f"Concurrent content {i}".encode() for i in range(num_operations)]
-        test_digests = [self.calculate_digest(content) for content in test_contents]
+        test_contents = self._CONCURRENT_PAYLOADS
+        # Never sent to the server, so use the cheaper blake2b
+        test_digests = [self.calculate_digest(content, "blake2b") for content in test_contents]
         
         # Validate all digests are unique
-        assert len(set(test_digests)) == len(test_digests), "All digests should be unique"
+        self._require(len(set(test_digests)) == len(test_digests), "All digests should be unique")
         
         # Validate content-digest mapping consistency
         for i, (content, digest) in enumerate(zip(test_contents, test_digests)):
-            recalculated = self.calculate_digest(content)
-            assert digest == recalculated, f"Digest should be consistent for content {i}"
+            recalculated = self.calculate_digest(content, "blake2b")
+            self._require(digest == recalculated, f"Digest should be consistent for content {i}")
         
         return True
     
@@ -482,15 +538,15 @@ class StorageAPITester:
         # Test with invalid/empty inputs
         try:
             empty_digest = self.calculate_digest(b"")
-            assert empty_digest.startswith("sha256:"), "Should handle empty content"
+            self._require(empty_digest.startswith("sha256:"), "Should handle empty content")
         except Exception:
             return False
         
         # Test with large content
         try:
-            large_content = b"x" * 10000
-            large_digest = self.calculate_digest(large_content)
-            assert large_digest.startswith("sha256:"), "Should handle large content"
+            # Hashed chunk by chunk so the payload is never built in memory
+            large_digest = self.calculate_digest_stream(repeated_chunks(b"x", 10000))
+            self._require(large_digest.startswith("sha256:"), "Should handle large content")
         except Exception:
             return False
         
@@ -499,16 +555,10 @@ class StorageAPITester:
     def _run_mock_storage_validation(self) -> bool:
         """Mock test for storage validation"""
         # Test various content types
-        test_cases = [
-            (b"Text content", "text/plain"),
-            (b"\x89PNG\r\n\x1a\n", "image/png"),  # PNG header
-            (b"Binary\x00\x01\x02\x03", "application/octet-stream"),
-        ]
-        
-        for content, expected_type in test_cases:
+        for content, expected_type in self._CONTENT_TYPE_CASES:
             digest = self.calculate_digest(content)
-            assert digest.startswith("sha256:"), f"Should handle {expected_type} content"
-            assert len(content) >= 0, "Content length should be non-negative"
+            self._require(digest.startswith("sha256:"), f"Should handle {expected_type} content")
+            self._require(len(content) >= 0, "Content length should be non-negative")
         
         return True
 
@@ -517,7 +567,9 @@ class StorageAPITester:
 @pytest.fixture(scope="module")
 def storage_tester():
     """Fixture to provide StorageAPITester instance"""
-    return StorageAPITester()
+    tester = StorageAPITester()
+    yield tester
+    tester.close()
 
 
 # Pytest test functions
@@ -549,7 +601,10 @@ def test_health_check_pytest(storage_tester):
 def main():
     """Main test runner"""
     tester = StorageAPITester()
-    passed, total = tester.run_all_tests()
+    try:
+        passed, total = tester.run_all_tests()
+    finally:
+        tester.close()
     
     logger.info("")
     logger.info("============================================================")
@@ -566,15 +621,15 @@ def main():
     
     for i, name in enumerate(test_names):
         status = "✓ PASSED" if i < passed else "❌ FAILED"
-        logger.info(f"{name:<30} : {status}")
+        logger.info("%-30s : %s", name, status)
     
-    logger.info(f"\nTotal: {passed}/{total} tests passed")
+    logger.info("\nTotal: %s/%s tests passed", passed, total)
     
     if passed == total:
         logger.info("\n🎉 All tests passed!")
         return 0
     else:
-        logger.info(f"\n❌ {total - passed} tests failed!")
+        logger.info("\n❌ %s tests failed!", total - passed)
         return 1
 
 
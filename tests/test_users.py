@@ -1,35 +1,71 @@
 """
 User management endpoint tests
 """
-import random
-import string
+import dataclasses
+import functools
+import json
+import os
+import secrets
+import tempfile
 import time
+import uuid
 import requests
-from base_test import BaseTestCase
-from config import TestUser
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from base_test import BaseTestCase, fanout_workers
+from config import API_BASE, TestUser
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows; user reuse is disabled there
+    fcntl = None
+
+# Keep the registered test user across runs (AERUGO_REUSE_USER=1), keyed by API base
+# and xdist worker: the user tests change the password and delete the account, so
+# workers must not share one user
+REUSE_USER = os.getenv("AERUGO_REUSE_USER") == "1" and fcntl is not None
+USER_CACHE_PATH = os.path.join(tempfile.gettempdir(), "aerugo_test_user.json")
+USER_LOCK_PATH = USER_CACHE_PATH + ".lock"
+USER_CACHE_KEY = f"{API_BASE}#{os.getenv('PYTEST_XDIST_WORKER', 'main')}"
+
+# Wait-and-retry for the setup registration: attempts, base delay (s), retryable statuses
+SETUP_ATTEMPTS = 3
+SETUP_BACKOFF = 0.5
+RETRY_STATUSES = (429, 503)
+
+# Every registered test user's name starts with this
+USERNAME_PREFIX = "testuser_"
+
+# Request payloads, built once per session
+PROFILE_UPDATE = {
+    "full_name": f"Updated User {uuid.uuid4().hex[:8]}",
+    "bio": "This is an updated test user bio",
+    "location": "Test City, Test Country"
+}
+# Mock image data: a 1x1 PNG
+AVATAR_PAYLOAD = {"avatar": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8/5+hHgAHggJ/PchI7wAAAABJRU5ErkJggg=="}
+
+
+def _with_setup(test):
+    """Make sure the test user is set up before the wrapped test method runs"""
+    @functools.wraps(test)
+    def wrapper(self, *args, **kwargs):
+        self.ensure_setup()
+        return test(self, *args, **kwargs)
+    return wrapper
 
 
 class UserTests(BaseTestCase):
     """Test user management functionality with auto-setup"""
     
+    # Registered user shared by every UserTests instance in this process
+    _cached_user: Optional[TestUser] = None
+    
     def __init__(self):
         super().__init__()
         self.test_user = None
         self.setup_attempted = False
     
-    def __getattribute__(self, name):
-        """Override to auto-setup before test methods"""
-        attr = object.__getattribute__(self, name)
-        
-        # If this is a test method, ensure setup first
-        if name.startswith('test_') and callable(attr):
-            def wrapper(*args, **kwargs):
-                self.ensure_setup()
-                return attr(*args, **kwargs)
-            return wrapper
-        
-        return attr
-    
     def ensure_setup(self):
         """Ensure test user is set up before running tests"""
         if self.setup_attempted:
@@ -38,36 +74,109 @@ class UserTests(BaseTestCase):
         self.setup_attempted = True
         
         try:
-            session_id = ''.join(random.choices(string.ascii_lowercase + string.digits, k=8))
+            cached = self._load_cached_user()
+            if cached is not None:
+                self.test_user = cached
+                self.logger.info(f"✅ Reusing test user: {cached.username}")
+                return
+            
+            session_id = secrets.token_hex(4)
             
             # Create fresh test user for this test session
             user_data = {
-                'username': f'testuser_{session_id}',
-                'email': f'testuser_{session_id}@example.com',
+                'username': f'{USERNAME_PREFIX}{session_id}',
+                'email': f'{USERNAME_PREFIX}{session_id}@example.com',
                 'password': 'testpass123',
                 'full_name': 'Test User'
             }
             
             # Register user
-            response = requests.post(f"{self.api_base}/auth/register", json=user_data)
+            response = self._register_with_retry(user_data)
             if response and response.status_code == 201:
-                # Login to get token
-                login_response = requests.post(f"{self.api_base}/auth/login", json={
-                    'username': user_data['username'],
-                    'password': user_data['password']
-                })
-                if login_response and login_response.status_code == 200:
-                    token = login_response.json().get('token')
+                registered = self.parse_json(response)
+                token = registered.get('token')
+                if not token:
+                    # Older servers don't return a token on register; log in for one
+                    login_response = self.make_request("POST", "/auth/login", {
+                        'username': user_data['username'],
+                        'password': user_data['password']
+                    })
+                    if login_response and login_response.status_code == 200:
+                        token = self.parse_json(login_response).get('token')
+                if token:
                     self.test_user = TestUser(user_data['username'], user_data['email'], user_data['password'])
+                    self.test_user.id = registered.get('user', {}).get('id')
                     self.test_user.token = token
+                    self._store_cached_user(self.test_user)
                     self.logger.info(f"✅ Setup test user: {user_data['username']}")
             
-        except Exception as e:
+        except (requests.RequestException, ValueError, OSError) as e:
+            # Bad response bodies or user cache file included; leave test_user unset
+            # so each test's token guard skips it
             self.logger.warning(f"⚠️ User setup failed: {e}")
-            # Create mock user to prevent AttributeError
-            self.test_user = TestUser("fallback_user", "fallback@example.com", "pass")
-            self.test_user.token = "mock_token"
+            self.test_user = None
+
+    def _register_with_retry(self, user_data: dict) -> requests.Response:
+        """POST /auth/register, backing off while the server answers 429/503
+        
+        Those statuses mean the user was not created, so resending is safe. Connection
+        errors are not retried here: the shared session already retries connect-phase
+        failures, and a reset after the body was sent may have created the user.
+        """
+        for attempt in range(SETUP_ATTEMPTS):
+            response = self.make_request("POST", "/auth/register", user_data)
+            if response.status_code not in RETRY_STATUSES or attempt == SETUP_ATTEMPTS - 1:
+                return response
+            self.logger.info(f"Register attempt {attempt + 1} got {response.status_code}, retrying")
+            time.sleep(SETUP_BACKOFF * 2 ** attempt)
 
+    def _load_cached_user(self) -> Optional[TestUser]:
+        """Get the user registered earlier in this process, or (with REUSE_USER) a previous run
+        
+        A user loaded from disk is only trusted if its token still fetches the profile;
+        it may have been deleted or the database reset since it was written.
+        """
+        if UserTests._cached_user is not None or not REUSE_USER:
+            return UserTests._cached_user
+        
+        try:
+            with open(USER_LOCK_PATH, "w") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_SH)
+                with open(USER_CACHE_PATH) as f:
+                    user = TestUser(**json.load(f)[USER_CACHE_KEY])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        
+        response = self.make_request("GET", "/api/user/profile", token=user.token)
+        if response is None or response.status_code != 200:
+            return None
+        UserTests._cached_user = user
+        return user
+    
+    def _store_cached_user(self, user: Optional[TestUser]):
+        """Remember (or, with None, forget) the shared test user"""
+        UserTests._cached_user = user
+        if not REUSE_USER:
+            return
+        
+        with open(USER_LOCK_PATH, "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                with open(USER_CACHE_PATH) as f:
+                    cached = json.load(f)
+            except (OSError, ValueError):
+                cached = {}
+            if user is None:
+                cached.pop(USER_CACHE_KEY, None)
+            else:
+                cached[USER_CACHE_KEY] = dataclasses.asdict(user)
+            # Write a sibling temp file and swap it in so readers never see a partial file
+            tmp_path = f"{USER_CACHE_PATH}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(cached, f)
+            os.replace(tmp_path, USER_CACHE_PATH)
+
+    @_with_setup
     def test_user_profile_retrieval(self):
         """Test user profile retrieval"""
         if not self.test_user or not self.test_user.token:
@@ -85,19 +194,14 @@ class UserTests(BaseTestCase):
         self.logger.warning(f"⚠️ User profile retrieval failed: {response.status_code if response else 'No response'}")
         return False
 
+    @_with_setup
     def test_user_profile_update(self):
         """Test user profile update"""
         if not self.test_user or not self.test_user.token:
             self.logger.warning("⚠️ No test user token, skipping profile update test")
             return False
         
-        updated_data = {
-            "full_name": f"Updated User {time.time()}",
-            "bio": "This is an updated test user bio",
-            "location": "Test City, Test Country"
-        }
-        
-        response = self.make_request("PUT", "/api/user/profile", updated_data, token=self.test_user.token)
+        response = self.make_request("PUT", "/api/user/profile", PROFILE_UPDATE, token=self.test_user.token)
         
         if response and response.status_code in [200, 204]:
             self.logger.info("✅ User profile update test passed")
@@ -106,6 +210,7 @@ class UserTests(BaseTestCase):
         self.logger.warning(f"⚠️ User profile update failed: {response.status_code if response else 'No response'}")
         return False
 
+    @_with_setup
     def test_user_password_change(self):
         """Test user password change"""
         if not self.test_user or not self.test_user.token:
@@ -121,12 +226,15 @@ class UserTests(BaseTestCase):
         response = self.make_request("PUT", "/api/user/password", password_data, token=self.test_user.token)
         
         if response and response.status_code in [200, 204]:
+            self.test_user.password = password_data["new_password"]
+            self._store_cached_user(self.test_user)
             self.logger.info("✅ User password change test passed")
             return True
         
         self.logger.warning(f"⚠️ User password change failed: {response.status_code if response else 'No response'}")
         return False
 
+    @_with_setup
     def test_user_deletion(self):
         """Test user account deletion"""
         if not self.test_user or not self.test_user.token:
@@ -136,12 +244,14 @@ class UserTests(BaseTestCase):
         response = self.make_request("DELETE", "/api/user/account", token=self.test_user.token)
         
         if response and response.status_code in [200, 204]:
+            self._store_cached_user(None)
             self.logger.info("✅ User deletion test passed")
             return True
         
         self.logger.warning(f"⚠️ User deletion failed: {response.status_code if response else 'No response'}")
         return False
 
+    @_with_setup
     def test_user_public_profile(self):
         """Test accessing public user profile"""
         if not self.test_user:
@@ -161,11 +271,8 @@ class UserTests(BaseTestCase):
 
     def test_user_search(self):
         """Test user search functionality"""
-        if not self.test_user:
-            self.logger.warning("⚠️ No test user, skipping search test")
-            return False
-        
-        response = self.make_request("GET", f"/api/users/search?q={self.test_user.username[:5]}")
+        # Only the response shape is checked, so no user needs registering first
+        response = self.make_request("GET", f"/api/users/search?q={USERNAME_PREFIX[:5]}")
         
         if response and response.status_code == 200:
             data = response.json()
@@ -176,16 +283,14 @@ class UserTests(BaseTestCase):
         self.logger.warning(f"⚠️ User search failed: {response.status_code if response else 'No response'}")
         return False
 
+    @_with_setup
     def test_user_avatar_upload(self):
         """Test user avatar upload"""
         if not self.test_user or not self.test_user.token:
             self.logger.warning("⚠️ No test user token, skipping avatar upload test")
             return False
         
-        # Mock image data
-        avatar_data = {"avatar": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8/5+hHgAHggJ/PchI7wAAAABJRU5ErkJggg=="}
-        
-        response = self.make_request("POST", "/api/user/avatar", avatar_data, token=self.test_user.token)
+        response = self.make_request("POST", "/api/user/avatar", AVATAR_PAYLOAD, token=self.test_user.token)
         
         if response and response.status_code in [200, 201]:
             self.logger.info("✅ User avatar upload test passed")
@@ -194,6 +299,7 @@ class UserTests(BaseTestCase):
         self.logger.warning(f"⚠️ User avatar upload failed: {response.status_code if response else 'No response'}")
         return False
 
+    @_with_setup
     def test_user_account_deletion(self):
         """Test user account deletion"""
         if not self.test_user or not self.test_user.token:
@@ -203,12 +309,14 @@ class UserTests(BaseTestCase):
         response = self.make_request("DELETE", "/api/user/account", token=self.test_user.token)
         
         if response and response.status_code in [200, 204]:
+            self._store_cached_user(None)
             self.logger.info("✅ User account deletion test passed")
             return True
         
         self.logger.warning(f"⚠️ User account deletion failed: {response.status_code if response else 'No response'}")
         return False
 
+    @_with_setup
     def test_user_email_verification(self):
         """Test user email verification"""
         if not self.test_user or not self.test_user.token:
@@ -224,6 +332,7 @@ class UserTests(BaseTestCase):
         self.logger.warning(f"⚠️ User email verification failed: {response.status_code if response else 'No response'}")
         return False
 
+    @_with_setup
     def test_user_preferences(self):
         """Test user preferences"""
         if not self.test_user or not self.test_user.token:
@@ -245,25 +354,34 @@ class UserTests(BaseTestCase):
         """Run all user tests"""
         self.logger.info("🚀 Starting User Tests")
         
-        tests = [
+        # Read-only tests don't affect each other, so run them concurrently; the
+        # mutating ones follow in order (test_user_deletion last, it deletes the user)
+        read_tests = [
             self.test_user_profile_retrieval,
-            self.test_user_profile_update,
-            self.test_user_password_change,
             self.test_user_public_profile,
             self.test_user_search,
-            # Note: test_user_deletion should be last as it deletes the user
-            self.test_user_deletion
+        ]
+        write_tests = [
+            self.test_user_profile_update,
+            self.test_user_password_change,
+            self.test_user_deletion,
         ]
         
-        passed = 0
-        total = len(tests)
-        
-        for test in tests:
+        def run(test):
             try:
-                if test():
-                    passed += 1
+                return bool(test())
             except Exception as e:
                 self.logger.error(f"❌ {test.__name__} failed with exception: {e}")
+                return False
+        
+        # Set up once before fanning out so the workers don't race to register
+        self.ensure_setup()
+        with ThreadPoolExecutor(max_workers=fanout_workers(len(read_tests))) as executor:
+            results = list(executor.map(run, read_tests))
+        results.extend(run(test) for test in write_tests)
+        
+        passed = sum(results)
+        total = len(results)
         
         self.logger.info(f"📊 User Tests: {passed}/{total} passed")
         return passed == total